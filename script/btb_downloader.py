@@ -8,6 +8,7 @@ Vibe coded with Claude 3.7 Sonnet.
 
 Usage:
   btb_downloader.py [--output-dir=<dir>] [--delay=<seconds>] [--limit=<count>]
+                    [--workers=<count>] [--rebuild-index] [--io-uring]
   btb_downloader.py (-h | --help)
   btb_downloader.py --version
 
@@ -17,19 +18,42 @@ Options:
   --output-dir=<dir>  Directory to save episode files [default: episodes].
   --delay=<seconds>   Delay between requests in seconds [default: 1].
   --limit=<count>     Limit number of episodes to download [default: 10].
+  --workers=<count>   Number of episode pages to fetch concurrently [default: 8].
+  --rebuild-index     Ignore the saved episode index and rescan every file.
+  --io-uring          Batch episode file writes through io_uring (Linux only,
+                      requires the liburing package).
 
 """
+import functools
+import html
+import importlib.util
+import io
+import json
 import os
 import re
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import quote
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import orjson
 from docopt import docopt
+from selectolax.lexbor import LexborHTMLParser
+
+try:
+    import liburing
+except ImportError:  # Optional; only used with --io-uring
+    liburing = None
+
+# httpx decodes brotli responses when either of these packages is installed
+BROTLI_AVAILABLE = any(
+    importlib.util.find_spec(name) for name in ("brotli", "brotlicffi")
+)
 
 
 class EpisodeDownloader:
@@ -39,31 +63,158 @@ class EpisodeDownloader:
     API_BASE_URL = "https://us.api.iheart.com/api/v3/podcast/podcasts/29236323/episodes"
     USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                   "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    VERSION = "1.3.7"  # Script version
+    VERSION = "1.3.8"  # Script version
+
+    EXCLUDED_TITLE = "it could happen here"  # Sister show in the same feed
+    API_PAGE_SIZE = 100  # Episodes requested per API call
+    HEADER_READ_SIZE = 1024  # URL and version live in the first few lines
+    INDEX_FILENAME = ".btb_index.json"
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 2  # Seconds, doubled on each retry
+    MAX_RETRY_AFTER = 120  # Upper bound on a server-requested wait, in seconds
+    RETRY_STATUSES = frozenset({429, 502, 503, 504})
+    URING_BATCH_SIZE = 32  # Files written per io_uring flush
+    URING_QUEUE_DEPTH = 64  # Room for a linked write + close per file
+
+    _COLLAPSE_NL = re.compile(r'\n{3,}')
+    _SLUG_RE = re.compile(r'[^a-z0-9]+')
+    _PRIVACY_P_RE = re.compile(
+        r'<p\b[^>]*>(?:(?!</p>).)*omnystudio\.com/listener(?:(?!</p>).)*</p>',
+        re.IGNORECASE | re.DOTALL
+    )
+    _TAG_RE = re.compile(r'<[^>]+>')
+
+    # Transcript span kinds, keyed by their exact CSS class
+    _SPEAKER, _TIME, _TEXT = range(3)
+    _SPAN_KINDS = {
+        "podcast-transcription-speaker": _SPEAKER,
+        "podcast-transcription-time": _TIME,
+        "podcast-transcription-text": _TEXT,
+    }
 
     def __init__(
-        self, output_dir: str = "episodes", delay: int = 1, limit: int = 10
+        self, output_dir: str = "episodes", delay: int = 1, limit: int = 10,
+        workers: int = 8, rebuild_index: bool = False, io_uring: bool = False
     ) -> None:
         """Initialize the EpisodeDownloader.
 
         Args:
             output_dir: Directory to save episode files.
-            delay: Delay between requests in seconds.
+            delay: Minimum delay between outgoing requests in seconds.
             limit: Maximum number of episodes to download.
+            workers: Number of episode pages to fetch concurrently.
+            rebuild_index: Ignore the saved episode index and rescan every file.
+            io_uring: Batch episode file writes through io_uring.
         """
         self.output_dir = output_dir
         self.delay = delay
         self.limit = limit
-        self.session = requests.Session()
+        self.workers = max(1, workers)
+        self.rebuild_index = rebuild_index
+        self._index_path = Path(self.output_dir) / self.INDEX_FILENAME
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._index_dirty = False
+        if io_uring and liburing is None:
+            print("liburing is not installed; writing files synchronously")
+        self.io_uring = io_uring and liburing is not None
+        self._pending_writes: List[Tuple[str, bytes, str, str]] = []
+        self._request_lock = threading.Lock()
+        self._last_request_time = float("-inf")
+        # HTTP/2 (requires the ``h2`` package) multiplexes the concurrent
+        # episode fetches over a single connection; all retries are left to
+        # _get, and the default transport keeps honoring proxy variables
+        self.session = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            timeout=httpx.Timeout(30.0),
+            # requests followed redirects by default; httpx needs opting in
+            follow_redirects=True,
+        )
         self.session.headers.update({
             "User-Agent": self.USER_AGENT,
             "Accept": "application/json, text/plain, */*",
             "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "br, gzip, deflate" if BROTLI_AVAILABLE else "gzip, deflate",
             "Origin": "https://www.iheart.com",
             "Referer": "https://www.iheart.com/",
         })
         self._create_output_dir()
-        self.existing_episodes, self.outdated_episodes = self._get_existing_episodes()
+        # Filled in by download_episodes once the wanted episodes are known
+        self.existing_episodes: Set[str] = set()
+        self.outdated_episodes: Set[str] = set()
+        self.saved_count = 0
+
+    def _throttle(self) -> None:
+        """Block until the next request may be sent.
+
+        Requests are spaced at least ``self.delay`` seconds apart across all
+        threads, so adding workers never increases the request rate.
+        """
+        with self._request_lock:
+            wait = self._last_request_time + self.delay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request_time = time.monotonic()
+
+    def _get(self, url: str) -> httpx.Response:
+        """GET a URL, retrying transient failures with backoff.
+
+        Args:
+            url: The URL to fetch.
+
+        Returns:
+            The successful response.
+
+        Raises:
+            httpx.HTTPStatusError: If the final attempt is still an error.
+            httpx.TransportError: If the final attempt fails in transport.
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            self._throttle()
+            try:
+                response = self.session.get(url)
+            except httpx.TransportError:
+                # Read timeouts, dropped connections, HTTP/2 GOAWAY, etc.
+                if attempt == self.MAX_RETRIES:
+                    raise
+                time.sleep(self.RETRY_BACKOFF * 2 ** attempt)
+                continue
+
+            if (response.status_code not in self.RETRY_STATUSES
+                    or attempt == self.MAX_RETRIES):
+                break
+            time.sleep(self._retry_delay(response, attempt))
+
+        response.raise_for_status()
+        return response
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Get how long to wait before retrying a failed response.
+
+        Args:
+            response: The response with a retryable status.
+            attempt: The zero-based number of the attempt that failed.
+
+        Returns:
+            The exponential backoff, or the server's Retry-After if longer
+            (capped at MAX_RETRY_AFTER).
+        """
+        delay = self.RETRY_BACKOFF * 2 ** attempt
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return delay
+
+        # Retry-After is either a number of seconds or an HTTP date
+        try:
+            requested = float(retry_after)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(retry_after)
+                requested = (when - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return delay
+
+        return max(delay, min(requested, self.MAX_RETRY_AFTER))
 
     def _create_output_dir(self) -> None:
         """Create the output directory if it doesn't exist."""
@@ -81,29 +232,140 @@ class EpisodeDownloader:
         existing_episodes = set()
         outdated_episodes = set()
 
-        for file_path in Path(self.output_dir).glob("*.txt"):
-            with open(file_path, "r", encoding="utf-8") as f:
-                url = None
-                version = None
+        # Only files that are new or changed since the index was written
+        # need their headers read
+        index = {} if self.rebuild_index else self._load_index()
+        current = {}
+        stale = []
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                if not (entry.name.endswith(".txt") and entry.is_file()):
+                    continue
+                mtime_ns = entry.stat().st_mtime_ns
+                cached = index.get(entry.name)
+                if cached and cached.get("mtime_ns") == mtime_ns:
+                    current[entry.name] = cached
+                else:
+                    stale.append((entry.name, entry.path, mtime_ns))
+
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(32, len(stale))) as executor:
+                headers = executor.map(self._scan_header, [path for _, path, _ in stale])
+                for (name, _, mtime_ns), (url, version) in zip(stale, headers):
+                    current[name] = {"url": url, "version": version, "mtime_ns": mtime_ns}
+
+        self._index = current
+        if stale or len(current) != len(index):
+            self._write_index()
+
+        for entry in current.values():
+            url = entry.get("url")
+            if url:
+                existing_episodes.add(url)
+                # If version is missing or different, add to outdated episodes
+                if entry.get("version") != self.VERSION:
+                    outdated_episodes.add(url)
+
+        return existing_episodes, outdated_episodes
 
-                for line in f:
-                    if line.startswith("URL: "):
-                        url = line[5:].strip()
-                    elif line.startswith("BTB Downloader Version: "):
-                        version = line[23:].strip()
+    def _probe_existing_episodes(
+        self, candidates: List[Tuple[Dict[str, Any], str, str]]
+    ) -> Optional[Tuple[Set[str], Set[str]]]:
+        """Check only the files the given episodes would be saved to.
 
-                    if url and version:
-                        break
+        Args:
+            candidates: (episode, episode_url, filename) tuples to look up.
 
-                if url:
-                    existing_episodes.add(url)
-                    # If version is missing or different, add to outdated episodes
-                    if version != self.VERSION:
-                        outdated_episodes.add(url)
+        Returns:
+            A tuple containing (existing_episodes, outdated_episodes) for the
+            candidates, or None if any expected file is missing or belongs to
+            another URL and a full scan is needed.
+        """
+        if self.rebuild_index:
+            return None
+
+        index = self._load_index()
+        changed = False
+        existing_episodes = set()
+        outdated_episodes = set()
+
+        for _, url, filename in candidates:
+            filepath = os.path.join(self.output_dir, filename)
+            try:
+                mtime_ns = os.stat(filepath).st_mtime_ns
+            except FileNotFoundError:
+                return None
+
+            entry = index.get(filename)
+            if not entry or entry.get("mtime_ns") != mtime_ns:
+                header_url, version = self._scan_header(filepath)
+                entry = {"url": header_url, "version": version, "mtime_ns": mtime_ns}
+                index[filename] = entry
+                changed = True
+            if entry.get("url") != url:
+                return None
+
+            existing_episodes.add(url)
+            if entry.get("version") != self.VERSION:
+                outdated_episodes.add(url)
+
+        self._index = index
+        if changed:
+            self._write_index()
 
         return existing_episodes, outdated_episodes
 
-    def _slugify(self, text: str) -> str:
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the saved episode index.
+
+        Returns:
+            A mapping of filename to its url, version and mtime_ns, or an
+            empty dict if the index is missing or unreadable.
+        """
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _write_index(self) -> None:
+        """Atomically write the episode index to the output directory."""
+        tmp_path = self._index_path.with_name(self._index_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
+        self._index_dirty = False
+
+    def _scan_header(self, file_path: str) -> Tuple[Optional[str], Optional[str]]:
+        """Read the URL and downloader version from an episode file header.
+
+        Args:
+            file_path: Path to the episode file.
+
+        Returns:
+            A tuple containing (url, version); either may be None if missing.
+        """
+        url = None
+        version = None
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            header = f.read(self.HEADER_READ_SIZE)
+
+        for line in header.splitlines():
+            if line.startswith("URL: "):
+                url = line[5:].strip()
+            elif line.startswith("BTB Downloader Version: "):
+                version = line[23:].strip()
+
+            if url and version:
+                break
+
+        return url, version
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _slugify(text: str) -> str:
         """Convert text to URL slug.
 
         Args:
@@ -112,15 +374,8 @@ class EpisodeDownloader:
         Returns:
             A URL-friendly slug.
         """
-        # Convert to lowercase
-        text = text.lower()
-        # Replace non-alphanumeric with hyphens
-        text = re.sub(r'[^a-z0-9]+', '-', text)
-        # Remove leading/trailing hyphens
-        text = text.strip('-')
-        # Collapse multiple hyphens
-        text = re.sub(r'-+', '-', text)
-        return text
+        # Replace runs of non-alphanumerics with a single hyphen, then trim
+        return EpisodeDownloader._SLUG_RE.sub('-', text.lower()).strip('-')
 
     def _build_episode_url(self, episode: Dict[str, Any]) -> str:
         """Build episode URL from episode data.
@@ -139,38 +394,42 @@ class EpisodeDownloader:
 
         return f"https://www.iheart.com/podcast/{podcast_slug}-{podcast_id}/episode/{title_slug}-{episode_id}/"
 
-    def _format_date(self, timestamp_ms: int) -> str:
-        """Convert a timestamp in milliseconds to a formatted date string.
+    def _episode_dates(self, episode: Dict[str, Any]) -> Tuple[str, str]:
+        """Get an episode's display and filename dates.
 
         Args:
-            timestamp_ms: The timestamp in milliseconds.
+            episode: The episode data dictionary.
 
         Returns:
-            A formatted date string.
+            A tuple of (formatted date, YYYY-MM-DD date).
         """
+        # Normalize first so the cached formatter only sees hashable ints
         try:
-            dt = datetime.fromtimestamp(timestamp_ms / 1000)
-            return dt.strftime("%B %d, %Y")
+            timestamp_ms = int(episode.get("startDate", 0))
         except (ValueError, TypeError, OverflowError):
-            return "Unknown Date"
+            return "Unknown Date", "Unknown-Date"
+        return self._format_dates(timestamp_ms)
 
-    def _format_date_for_filename(self, timestamp_ms: int) -> str:
-        """Convert a timestamp in milliseconds to YYYY-MM-DD format.
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_dates(timestamp_ms: int) -> Tuple[str, str]:
+        """Convert a timestamp in milliseconds to display and filename dates.
 
         Args:
             timestamp_ms: The timestamp in milliseconds.
 
         Returns:
-            The date in YYYY-MM-DD format, or "Unknown-Date" if parsing fails.
+            A tuple of (formatted date, YYYY-MM-DD date), or
+            ("Unknown Date", "Unknown-Date") if parsing fails.
         """
         try:
             dt = datetime.fromtimestamp(timestamp_ms / 1000)
-            return dt.strftime("%Y-%m-%d")
-        except (ValueError, TypeError, OverflowError):
-            return "Unknown-Date"
+            return dt.strftime("%B %d, %Y"), dt.strftime("%Y-%m-%d")
+        except (ValueError, TypeError, OverflowError, OSError):
+            return "Unknown Date", "Unknown-Date"
 
-    def _safe_filename(self, episode: Dict[str, Any]) -> str:
-        """Create a safe filename from the episode data.
+    def _episode_filename(self, episode: Dict[str, Any]) -> str:
+        """Get the filename an episode is saved under.
 
         Args:
             episode: The episode data dictionary.
@@ -178,174 +437,201 @@ class EpisodeDownloader:
         Returns:
             A safe filename for the episode.
         """
-        # Get the title slug
-        title = episode.get('title', 'Unknown')
-        title_slug = self._slugify(title)
+        return self._safe_filename(
+            self._slugify(episode.get("title", "Unknown")),
+            self._episode_dates(episode)[1]
+        )
 
-        # Get formatted date
-        timestamp_ms = episode.get('startDate', 0)
-        formatted_date = self._format_date_for_filename(timestamp_ms)
+    def _safe_filename(self, title_slug: str, formatted_date: str) -> str:
+        """Create a safe filename from precomputed episode parts.
 
-        # Create safe filename
+        Args:
+            title_slug: The slugified episode title.
+            formatted_date: The episode date in YYYY-MM-DD format.
+
+        Returns:
+            A safe filename for the episode.
+        """
         return f"{formatted_date}_{title_slug}.txt"
 
+    def _fetch_episode_page(self, page_key: Optional[str]) -> Dict[str, Any]:
+        """Fetch and decode one page of the episode list API.
+
+        Args:
+            page_key: The page key from the previous response, or None for
+                the first page.
+
+        Returns:
+            The decoded API response.
+        """
+        # Prepare API URL with page_key if available
+        if page_key:
+            url = f"{self.API_BASE_URL}?newEnabled=false&limit={self.API_PAGE_SIZE}&pageKey={quote(page_key)}&sortBy=startDate-desc"
+        else:
+            url = f"{self.API_BASE_URL}?newEnabled=false&limit={self.API_PAGE_SIZE}&sortBy=startDate-desc"
+
+        # Make API request
+        response = self._get(url)
+        return orjson.loads(response.content)
+
     def _get_episode_list(self) -> List[Dict[str, Any]]:
         """Fetch the list of episodes using the iHeart API.
 
+        The next page is requested in the background as soon as its page key
+        is known, so it downloads while the current page is processed.
+
         Returns:
             A list of episode data dictionaries.
         """
-        all_episodes = []
+        total_episodes = 0
         filtered_episodes = []
-        page_key = None
-        api_limit = 20  # We can request more per call than the UI shows
 
         print("Fetching episode list from API...")
 
-        # Continue fetching until we have enough episodes or there are no more
-        while len(filtered_episodes) < self.limit:
-            # Prepare API URL with page_key if available
-            if page_key:
-                url = f"{self.API_BASE_URL}?newEnabled=false&limit={api_limit}&pageKey={quote(page_key)}&sortBy=startDate-desc"
-            else:
-                url = f"{self.API_BASE_URL}?newEnabled=false&limit={api_limit}&sortBy=startDate-desc"
-
-            print(f"Fetching episodes batch (total so far: {len(all_episodes)})")
-
-            # Make API request
-            response = self.session.get(url)
-            response.raise_for_status()
-            data = response.json()
-
-            # Extract episodes
-            batch_episodes = data.get("data", [])
-            if not batch_episodes:
-                print("No more episodes available in API")
-                break
-
-            all_episodes.extend(batch_episodes)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            print("Fetching episodes batch (total so far: 0)")
+            pending = executor.submit(self._fetch_episode_page, None)
+
+            # Continue fetching until we have enough episodes or there are no more
+            while pending is not None:
+                data = pending.result()
+                pending = None
+
+                # Extract episodes
+                batch_episodes = data.get("data", [])
+                if not batch_episodes:
+                    print("No more episodes available in API")
+                    break
+
+                page_key = data.get("pageKey")
+                # Also check links.next which is used in the API response
+                if not page_key and "links" in data and "next" in data["links"]:
+                    page_key = data["links"]["next"]
+
+                # Prefetch the next page unless this batch could fill the limit
+                if page_key and len(filtered_episodes) + len(batch_episodes) < self.limit:
+                    print(f"Fetching episodes batch (total so far: {total_episodes + len(batch_episodes)})")
+                    pending = executor.submit(self._fetch_episode_page, page_key)
+
+                total_episodes += len(batch_episodes)
+
+                # Filter for BTB episodes, looking only at the new batch
+                filtered_episodes.extend(
+                    episode for episode in batch_episodes
+                    if self.EXCLUDED_TITLE not in episode.get("title", "").lower()
+                )
 
-            # Filter for BTB episodes
-            filtered_episodes = [
-                episode for episode in all_episodes
-                if "it could happen here" not in episode.get("title", "").lower()
-            ]
+                print(f"Found {len(filtered_episodes)} Behind the Bastards episodes so far")
 
-            print(f"Found {len(filtered_episodes)} Behind the Bastards episodes so far")
+                # Check if we should continue
+                if not page_key:
+                    print("No more pages available in API")
+                    break
 
-            # Check if we should continue
-            page_key = data.get("pageKey")
-            # Also check links.next which is used in the API response
-            if not page_key and "links" in data and "next" in data["links"]:
-                page_key = data["links"]["next"]
+                if len(filtered_episodes) >= self.limit:
+                    break
 
-            if not page_key:
-                print("No more pages available in API")
-                break
+                if pending is None:
+                    print(f"Fetching episodes batch (total so far: {total_episodes})")
+                    pending = executor.submit(self._fetch_episode_page, page_key)
 
-            # Respect the delay between requests
-            time.sleep(self.delay)
-
-        print(f"Found {len(all_episodes)} total episodes from API")
+        print(f"Found {total_episodes} total episodes from API")
         print(f"Filtered to {len(filtered_episodes)} Behind the Bastards episodes")
 
         # Return only the episodes we need
         return filtered_episodes[:self.limit]
 
-    def _extract_transcript(self, soup: BeautifulSoup) -> str:
+    def _extract_transcript(self, tree: LexborHTMLParser) -> str:
         """Extract the episode transcript from the page.
 
         Args:
-            soup: The BeautifulSoup object for the episode page.
+            tree: The parsed HTML tree for the episode page.
 
         Returns:
             The episode transcript.
         """
         # Find the transcript section
-        transcript_section = soup.find("div", id="transcription")
+        transcript_section = tree.css_first("div#transcription")
         if not transcript_section:
             # Try alternative selectors
-            transcript_section = soup.find("div", class_=lambda c: c and "transcription" in c.lower())
+            transcript_section = tree.css_first('div[class*="transcription"]')
 
         if not transcript_section:
             return "No transcript available."
 
-        transcript_lines = []
+        buffer = io.StringIO()
         current_speaker = None
         new_speaker_found = False
+        after_header = False
 
-        # Find all spans in order
-        all_spans = transcript_section.find_all("span")
+        # Find all classed spans in order
+        all_spans = transcript_section.css("span[class]")
 
         # Process each span
         for span in all_spans:
-            span_class = span.get("class", [])
-            span_class_str = " ".join(span_class)
-
             # Check span type
-            if "podcast-transcription-speaker" in span_class_str:
-                current_speaker = span.text.strip()
+            kind = None
+            for span_class in (span.attributes.get("class") or "").split():
+                kind = self._SPAN_KINDS.get(span_class)
+                if kind is not None:
+                    break
+
+            if kind == self._SPEAKER:
+                current_speaker = span.text().strip()
                 new_speaker_found = True
 
-            elif "podcast-transcription-time" in span_class_str:
-                timestamp = span.text.strip()
+            elif kind == self._TIME:
+                timestamp = span.text().strip()
+
+                if buffer.tell():  # Add a blank line before each block
+                    buffer.write("\n\n")
 
                 if new_speaker_found and current_speaker:
                     # New speaker with timestamp
-                    if transcript_lines:  # Add a blank line before new speaker
-                        transcript_lines.append("\n")
-                    transcript_lines.append(f"{current_speaker} {timestamp}:")
+                    buffer.write(f"{current_speaker} {timestamp}:")
                     new_speaker_found = False
                 elif current_speaker:
                     # Continuing speaker with new timestamp
                     # Create whitespace of same length as speaker name
-                    if transcript_lines:  # Add a blank line before new timestamp
-                        transcript_lines.append("\n")
                     whitespace = " " * len(current_speaker)
-                    transcript_lines.append(f"{whitespace} {timestamp}:")
+                    buffer.write(f"{whitespace} {timestamp}:")
                 else:
                     # No speaker context
-                    if transcript_lines:  # Add a blank line
-                        transcript_lines.append("\n")
-                    transcript_lines.append(f"Speaker {timestamp}:")
+                    buffer.write(f"Speaker {timestamp}:")
+                after_header = True
 
-            elif "podcast-transcription-text" in span_class_str:
+            elif kind == self._TEXT:
                 # Add text
-                text = span.text.strip()
+                text = span.text().strip()
                 if text:
-                    if transcript_lines and transcript_lines[-1].endswith(":"):
+                    if after_header:
                         # First line after speaker/timestamp
-                        transcript_lines.append(f"\n{text}")
+                        buffer.write(f"\n{text}")
+                        after_header = False
+                    elif buffer.tell():
+                        # Continuation line
+                        buffer.write(f" {text}")
                     else:
-                        # Continuation line - check if we need a space
-                        if transcript_lines and not transcript_lines[-1].endswith("\n"):
-                            transcript_lines.append(f" {text}")
-                        else:
-                            transcript_lines.append(text)
+                        buffer.write(text)
 
-        # Join all transcript lines
-        transcript = "".join(transcript_lines).strip()
+        transcript = buffer.getvalue().strip()
 
         # Clean up empty lines (more than 2 consecutive newlines)
-        transcript = re.sub(r'\n{3,}', '\n\n', transcript)
-
-        # Make sure there's a line break after each speaker block
-        transcript = re.sub(r'([^.\n])\n([A-Z][a-z]+)', r'\1\n\n\2', transcript)
+        transcript = self._COLLAPSE_NL.sub('\n\n', transcript)
 
         return transcript if transcript else "No transcript available."
 
-    def _get_soup(self, url: str) -> BeautifulSoup:
-        """Get a BeautifulSoup object for the given URL.
+    def _get_tree(self, url: str) -> LexborHTMLParser:
+        """Get a parsed HTML tree for the given URL.
 
         Args:
-            url: The URL to get the soup for.
+            url: The URL of the page to parse.
 
         Returns:
-            A BeautifulSoup object for the given URL.
+            A selectolax Lexbor tree for the given URL.
         """
-        response = self.session.get(url)
-        response.raise_for_status()
-        return BeautifulSoup(response.text, "html.parser")
+        response = self._get(url)
+        return LexborHTMLParser(response.text)
 
     def _clean_html_description(self, html_description: str) -> str:
         """Clean HTML from description and remove privacy notice.
@@ -356,20 +642,29 @@ class EpisodeDownloader:
         Returns:
             A clean plain text description.
         """
-        # Parse the HTML
-        soup = BeautifulSoup(html_description, "html.parser")
+        # The API description is simple markup, so strip the privacy
+        # paragraph and tags directly unless the notice survives
+        stripped = self._PRIVACY_P_RE.sub('', html_description)
+        if "omnystudio.com/listener" not in stripped:
+            return html.unescape(self._TAG_RE.sub('', stripped)).strip()
+
+        # Fall back to a full parse
+        tree = LexborHTMLParser(html_description)
 
         # Remove privacy information paragraph
-        for p in soup.find_all("p"):
-            if p.find("a", href=lambda href: href and "omnystudio.com/listener" in href):
+        for p in tree.css("p"):
+            if p.css_first('a[href*="omnystudio.com/listener"]'):
                 p.decompose()
 
         # Return plain text
-        return soup.get_text().strip()
+        return (tree.body.text() if tree.body else "").strip()
 
     def _extract_summary_and_transcript(self, url: str, html_description: str) -> Tuple[str, str]:
         """Extract the summary and transcript.
 
+        Safe to call from worker threads: it only reads shared state and
+        performs a GET on the shared session.
+
         Args:
             url: The URL of the episode page.
             html_description: The HTML description from the API.
@@ -381,40 +676,190 @@ class EpisodeDownloader:
         summary = self._clean_html_description(html_description)
 
         # Get the page and extract transcript
-        soup = self._get_soup(url)
-        transcript = self._extract_transcript(soup)
+        tree = self._get_tree(url)
+        transcript = self._extract_transcript(tree)
 
         return summary, transcript
 
-    def _save_episode(self, episode: Dict[str, Any], summary: str, transcript: str) -> None:
+    def _write_file(self, filepath: str, payload: bytes) -> None:
+        """Write a complete file in as few syscalls as possible.
+
+        Args:
+            filepath: The path of the file to create or overwrite.
+            payload: The full encoded file contents.
+        """
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _wait_uring(ring: Any, cqe: Any) -> Tuple[int, Optional[int]]:
+        """Wait for the next io_uring completion and mark it seen.
+
+        Args:
+            ring: The liburing Ring.
+            cqe: The liburing Cqe buffer to wait on.
+
+        Returns:
+            A tuple of (user_data, result), where result is None if the
+            operation failed.
+        """
+        liburing.io_uring_wait_cqe(ring, cqe)
+        entry = cqe[0]
+        user_data = entry.user_data
+        try:
+            result = entry.res
+        except OSError:  # liburing raises for negative results
+            result = None
+        liburing.io_uring_cqe_seen(ring, entry)
+        return user_data, result
+
+    def _write_files_uring(self, files: List[Tuple[str, bytes]]) -> List[bool]:
+        """Write several files using batched io_uring submissions.
+
+        All files are opened with one submission, then every write is linked
+        to its close and the whole batch is submitted at once.
+
+        Args:
+            files: (filepath, payload) pairs to write.
+
+        Returns:
+            A success flag for each file, in the same order.
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        written = [False] * len(files)
+        fds: Dict[int, int] = {}
+        ring = liburing.Ring()
+        cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(self.URING_QUEUE_DEPTH, ring)
+        try:
+            for i, (filepath, _) in enumerate(files):
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_open(sqe, filepath, flags, 0o644)
+                liburing.io_uring_sqe_set_data64(sqe, i)
+            liburing.io_uring_submit(ring)
+            for _ in files:
+                i, fd = self._wait_uring(ring, cqe)
+                if fd is not None:
+                    fds[i] = fd
+
+            # user_data is 2*i for the write and 2*i + 1 for the close
+            for i, fd in fds.items():
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_write(sqe, fd, files[i][1], 0)
+                liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+                liburing.io_uring_sqe_set_data64(sqe, 2 * i)
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_close(sqe, fd)
+                liburing.io_uring_sqe_set_data64(sqe, 2 * i + 1)
+            liburing.io_uring_submit(ring)
+            for _ in range(2 * len(fds)):
+                user_data, result = self._wait_uring(ring, cqe)
+                i, is_close = divmod(user_data, 2)
+                if is_close:
+                    if result is not None:
+                        del fds[i]
+                elif result == len(files[i][1]):
+                    written[i] = True
+        finally:
+            # Close anything whose linked close was cancelled or never ran
+            for fd in fds.values():
+                os.close(fd)
+            liburing.io_uring_queue_exit(ring)
+
+        return written
+
+    def _flush_writes(self) -> None:
+        """Write all queued episode files and record the ones that succeed."""
+        if not self._pending_writes:
+            return
+        pending, self._pending_writes = self._pending_writes, []
+
+        written = [False] * len(pending)
+        # A single file gains nothing from io_uring
+        if len(pending) > 1:
+            try:
+                written = self._write_files_uring(
+                    [(filepath, payload) for filepath, payload, _, _ in pending]
+                )
+            except Exception as e:
+                print(f"io_uring write failed ({e}); writing files synchronously")
+                self.io_uring = False
+
+        for (filepath, payload, url, title), ok in zip(pending, written):
+            try:
+                if not ok:
+                    self._write_file(filepath, payload)
+                self._record_saved(filepath, url, title)
+            except Exception as e:
+                print(f"Error saving episode {url}: {e}")
+
+    def _record_saved(self, filepath: str, url: str, title: str) -> None:
+        """Record a freshly written episode file as downloaded.
+
+        Args:
+            filepath: The path of the written episode file.
+            url: The episode URL.
+            title: The episode title.
+        """
+        self._index[os.path.basename(filepath)] = {
+            "url": url,
+            "version": self.VERSION,
+            "mtime_ns": os.stat(filepath).st_mtime_ns,
+        }
+        self._index_dirty = True
+
+        # Update tracking sets
+        self.existing_episodes.add(url)
+        self.outdated_episodes.discard(url)
+        self.saved_count += 1
+
+        print(f"Saved episode: {title}")
+
+    def _save_episode(
+        self, episode: Dict[str, Any], url: str, filename: str,
+        summary: str, transcript: str
+    ) -> None:
         """Save the episode information to a file.
 
         Args:
             episode: The episode data from the API.
+            url: The episode URL, as built by _build_episode_url.
+            filename: The episode filename, as built by _episode_filename.
             summary: The episode summary.
             transcript: The episode transcript.
         """
         # Extract data from the API response
         title = episode.get("title", "Unknown Title")
-        timestamp_ms = episode.get("startDate", 0)
-        formatted_date = self._format_date(timestamp_ms)
+        display_date = self._episode_dates(episode)[0]
         length = f"{episode.get('duration', 0) // 60} mins"
-        url = self._build_episode_url(episode)
 
-        filename = self._safe_filename(episode)
         filepath = os.path.join(self.output_dir, filename)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(f"Title: {title}\n")
-            f.write(f"Date: {formatted_date}\n")
-            f.write(f"Length: {length}\n")
-            f.write(f"URL: {url}\n")
-            f.write(f"BTB Downloader Version: {self.VERSION}\n")
-            f.write(f"Summary: {summary}\n\n")
-            f.write("TRANSCRIPT:\n\n")
-            f.write(transcript)
-
-        print(f"Saved episode: {title}")
+        payload = (
+            f"Title: {title}\n"
+            f"Date: {display_date}\n"
+            f"Length: {length}\n"
+            f"URL: {url}\n"
+            f"BTB Downloader Version: {self.VERSION}\n"
+            f"Summary: {summary}\n\n"
+            "TRANSCRIPT:\n\n"
+            f"{transcript}"
+        ).encode("utf-8")
+
+        if self.io_uring:
+            # Queue the write; it happens when the batch is flushed
+            self._pending_writes.append((filepath, payload, url, title))
+            if len(self._pending_writes) >= self.URING_BATCH_SIZE:
+                self._flush_writes()
+            return
+
+        self._write_file(filepath, payload)
+        self._record_saved(filepath, url, title)
 
     def download_episodes(self) -> None:
         """Download episodes from the podcast API."""
@@ -426,56 +871,69 @@ class EpisodeDownloader:
 
         print(f"Working with {len(btb_episodes)} Behind the Bastards episodes (limit: {self.limit}).")
 
-        # Identify episodes to download
-        episodes_to_download = []
-        for episode in btb_episodes:
-            episode_url = self._build_episode_url(episode)
-
-            # Include if not downloaded or needs update due to version change
-            if (episode_url not in self.existing_episodes or
-                    episode_url in self.outdated_episodes):
-                episodes_to_download.append(episode)
+        # Derive each episode's URL and filename once; both are passed through
+        candidates = [
+            (episode, self._build_episode_url(episode), self._episode_filename(episode))
+            for episode in btb_episodes
+        ]
 
-        print(f"Found {len(episodes_to_download)} episodes to download/update.")
-
-        # Process each episode
-        downloaded_count = 0
-        for i, episode in enumerate(btb_episodes):
-            episode_url = self._build_episode_url(episode)
+        # Look at just the files these episodes map to before scanning everything
+        existing = self._probe_existing_episodes(candidates)
+        if existing is None:
+            print("Scanning existing episode files...")
+            existing = self._get_existing_episodes()
+        self.existing_episodes, self.outdated_episodes = existing
 
+        # Identify episodes to download
+        episodes_to_download = []
+        for i, (episode, episode_url, filename) in enumerate(candidates):
             # Skip already downloaded episodes (unless they need to be updated)
             if episode_url in self.existing_episodes and episode_url not in self.outdated_episodes:
                 print(f"Skipping already downloaded episode {i+1}/{len(btb_episodes)}: {episode.get('title')}")
                 continue
 
-            if episode_url in self.outdated_episodes:
-                print(f"Updating outdated episode {i+1}/{len(btb_episodes)}: {episode.get('title')}")
-            else:
-                print(f"Processing new episode {i+1}/{len(btb_episodes)}: {episode.get('title')}")
+            episodes_to_download.append((episode, episode_url, filename))
 
-            try:
-                # Get summary and transcript
-                summary, transcript = self._extract_summary_and_transcript(
-                    episode_url,
-                    episode.get("description", "")
-                )
+        print(f"Found {len(episodes_to_download)} episodes to download/update.")
+
+        # Fetch episode pages concurrently; files are written on this thread
+        self.saved_count = 0
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {}
+                for episode, episode_url, filename in episodes_to_download:
+                    if episode_url in self.outdated_episodes:
+                        print(f"Updating outdated episode: {episode.get('title')}")
+                    else:
+                        print(f"Processing new episode: {episode.get('title')}")
 
-                # Save the episode information
-                self._save_episode(episode, summary, transcript)
+                    future = executor.submit(
+                        self._extract_summary_and_transcript,
+                        episode_url,
+                        episode.get("description", "")
+                    )
+                    futures[future] = (episode, episode_url, filename)
 
-                # Update tracking sets
-                self.existing_episodes.add(episode_url)
-                if episode_url in self.outdated_episodes:
-                    self.outdated_episodes.remove(episode_url)
+                for future in as_completed(futures):
+                    episode, episode_url, filename = futures[future]
+                    try:
+                        summary, transcript = future.result()
 
-                downloaded_count += 1
+                        # Save the episode information; with io_uring the file
+                        # is only queued and is recorded once it is written
+                        self._save_episode(
+                            episode, episode_url, filename, summary, transcript
+                        )
 
-                # Throttle requests
-                if i < len(btb_episodes) - 1:
-                    time.sleep(self.delay)
+                    except Exception as e:
+                        print(f"Error processing episode {episode_url}: {e}")
+        finally:
+            self._flush_writes()
+            # The index is only a cache, so it is written once per run
+            if self._index_dirty:
+                self._write_index()
 
-            except Exception as e:
-                print(f"Error processing episode {episode_url}: {e}")
+        print(f"Downloaded {self.saved_count} of {len(episodes_to_download)} episodes.")
 
 
 def main() -> None:
@@ -485,8 +943,14 @@ def main() -> None:
     output_dir = arguments["--output-dir"]
     delay = float(arguments["--delay"])
     limit = int(arguments["--limit"])
-
-    downloader = EpisodeDownloader(output_dir=output_dir, delay=delay, limit=limit)
+    workers = int(arguments["--workers"])
+    rebuild_index = arguments["--rebuild-index"]
+    io_uring = arguments["--io-uring"]
+
+    downloader = EpisodeDownloader(
+        output_dir=output_dir, delay=delay, limit=limit, workers=workers,
+        rebuild_index=rebuild_index, io_uring=io_uring
+    )
     downloader.download_episodes()
 
 